@@ -5,143 +5,387 @@ Processes conversation data and generates static JSON files.
 """
 
 import json
+import os
+import re
 import time
 import shutil
 import subprocess
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def compute_total_conversation_time(events: list) -> float:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import msgspec
+
+    class EventMeta(msgspec.Struct):
+        """The only event fields the metadata pass needs."""
+
+        source: str | None = None
+        timestamp: str | None = None
+
+    _event_meta_decoder = msgspec.json.Decoder(EventMeta)
+
+    # Mirrors just the base_state.json paths the metadata pass reads; msgspec
+    # skips the unmentioned subtrees at the C level
+    class LLMLite(msgspec.Struct):
+        model: str | None = None
+
+    class AgentLite(msgspec.Struct):
+        id: str | None = None
+        llm: LLMLite | None = None
+
+    class TokenUsageLite(msgspec.Struct):
+        prompt_tokens: int = 0
+        completion_tokens: int = 0
+        reasoning_tokens: int = 0
+        cache_read_tokens: int = 0
+
+    class AgentUsageLite(msgspec.Struct):
+        accumulated_token_usage: TokenUsageLite | None = None
+
+    class StatsLite(msgspec.Struct):
+        usage_to_metrics: dict[str, AgentUsageLite] | None = None
+
+    class BaseStateLite(msgspec.Struct):
+        agent: AgentLite | None = None
+        stats: StatsLite | None = None
+
+    _base_state_decoder = msgspec.json.Decoder(BaseStateLite)
+except ImportError:
+    msgspec = None
+
+
+def loads_json(data: bytes):
+    """Parse JSON bytes, using orjson when available for faster parsing."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path):
+    """Load a JSON file, using orjson when available for faster parsing."""
+    return loads_json(path.read_bytes())
+
+
+def dumps_json(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes (compact by default), using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option, default=str)
+    if pretty:
+        return json.dumps(obj, indent=2, default=str).encode()
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+def dump_json(path: Path, obj, pretty: bool = False) -> None:
+    """Write JSON (compact by default), using orjson when available."""
+    path.write_bytes(dumps_json(obj, pretty))
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly these bytes.
+
+    Leaving identical files untouched preserves their mtime, which keeps
+    downstream watchers (rsync, HMR) from re-triggering on no-op rebuilds.
+
+    Returns:
+        True if the file was written
+    """
+    if path.exists():
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+    path.write_bytes(data)
+    return True
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Trajectory IDs are 32 hex chars
+_HEX32 = re.compile(r"[0-9a-f]{32}\Z", re.IGNORECASE)
+
+_MODULE_DIR = Path(__file__).resolve().parent
+_DEFAULT_CONV_DIR = Path.home() / ".openhands" / "conversations"
+
+
+@lru_cache(maxsize=65536)
+def parse_timestamp(timestamp: str | None) -> float | None:
+    """Parse an ISO-8601 timestamp to epoch seconds, or None if unparseable.
+
+    Memoized: batched agent/tool events frequently share timestamps, so
+    repeated strings become a dict lookup.
+    """
+    if not timestamp or not isinstance(timestamp, str):
+        return None
+    # Fast path for the "YYYY-MM-DDTHH:MM:SS[.ffffff]Z" format events use,
+    # avoiding datetime object allocation per event
+    s = timestamp
+    if len(s) >= 20 and s.endswith("Z") and s[10] == "T":
+        try:
+            days = date(int(s[0:4]), int(s[5:7]), int(s[8:10])).toordinal()
+            seconds = int(s[11:13]) * 3600 + int(s[14:16]) * 60 + float(s[17:-1])
+            return (days - _EPOCH_ORDINAL) * 86400.0 + seconds
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+def compute_total_conversation_time(parsed_events: list) -> float:
     """Calculate total conversation time (sum of all intervals except from user messages).
 
     Args:
-        events: List of events sorted by timestamp
+        parsed_events: List of (epoch_seconds, source) tuples sorted by timestamp
 
     Returns:
         Total time in seconds
     """
-    if len(events) < 2:
+    if len(parsed_events) < 2:
         return 0
 
     total_time = 0
 
-    for i in range(1, len(events)):
-        prev_event = events[i - 1]
-        curr_event = events[i]
-
+    for (prev_epoch, prev_source), (curr_epoch, _) in zip(
+        parsed_events, parsed_events[1:]
+    ):
         # Only count time if the previous event was NOT from user
-        if prev_event.get("source") != "user":
-            prev_timestamp = prev_event.get("timestamp")
-            curr_timestamp = curr_event.get("timestamp")
-
-            if prev_timestamp and curr_timestamp:
-                try:
-                    prev_dt = datetime.fromisoformat(
-                        prev_timestamp.replace("Z", "+00:00")
-                    )
-                    curr_dt = datetime.fromisoformat(
-                        curr_timestamp.replace("Z", "+00:00")
-                    )
-                    duration = (curr_dt - prev_dt).total_seconds()
-                    if duration > 0:
-                        total_time += duration
-                except (ValueError, TypeError):
-                    pass
+        if prev_source != "user" and prev_epoch is not None and curr_epoch is not None:
+            duration = curr_epoch - prev_epoch
+            if duration > 0:
+                total_time += duration
 
     return round(total_time, 1)
 
 
-def compute_trajectory_metadata(trajectory_path: Path) -> dict:
-    """Compute metadata for a single trajectory."""
-    trajectory_id = trajectory_path.name
+def load_base_state(trajectory_path: Path) -> bytes | None:
+    """Read base_state.json raw bytes, or None if missing/unreadable."""
     base_state_path = trajectory_path / "base_state.json"
-    events_dir = trajectory_path / "events"
-
-    # Default values
-    title = trajectory_id
-    model = None
-    prompt_tokens = 0
-    completion_tokens = 0
-    reasoning_tokens = 0
-    cache_read_tokens = 0
-    event_count = 0
-    avg_agent_turn_time = 0
-    total_conversation_time = 0
+    if not base_state_path.exists():
+        return None
+    try:
+        return base_state_path.read_bytes()
+    except OSError:
+        return None
+
+
+_BASE_SUMMARY_DEFAULTS = {
+    "title": None,
+    "model": None,
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "reasoning_tokens": 0,
+    "cache_read_tokens": 0,
+}
+
+
+def summarize_base_state(data: bytes | None) -> dict | None:
+    """Extract the scalar fields the metadata pass needs from base_state.json.
 
-    # Read base_state.json
-    if base_state_path.exists():
+    With msgspec, a typed decode over the raw bytes pulls out just these
+    fields without materializing the rest of the document; otherwise they are
+    read from a full parse.
+
+    Args:
+        data: Raw base_state.json bytes, or None
+
+    Returns:
+        Dict with title, model, and the four token counters, or None when
+        data is missing or not a valid JSON object
+    """
+    if data is None:
+        return None
+
+    summary = dict(_BASE_SUMMARY_DEFAULTS)
+
+    if msgspec is not None:
         try:
-            with open(base_state_path, "r") as f:
-                base_state = json.load(f)
-                # Get title from agent.id
-                if "agent" in base_state:
-                    agent = base_state.get("agent", {})
-                    if isinstance(agent, dict):
-                        title = agent.get("id", trajectory_id)
-                        # Get model from agent.llm.model
-                        llm = agent.get("llm", {})
-                        if isinstance(llm, dict):
-                            model = llm.get("model")
-                # Get token usage from stats
-                stats = base_state.get("stats", {})
-                usage = stats.get("usage_to_metrics", {})
-                agent_usage = usage.get("agent", {})
-                token_usage = agent_usage.get("accumulated_token_usage", {})
-                prompt_tokens = token_usage.get("prompt_tokens", 0)
-                completion_tokens = token_usage.get("completion_tokens", 0)
-                reasoning_tokens = token_usage.get("reasoning_tokens", 0)
-                cache_read_tokens = token_usage.get("cache_read_tokens", 0)
-        except (json.JSONDecodeError, IOError):
+            lite = _base_state_decoder.decode(data)
+        except msgspec.ValidationError:
+            # Valid JSON whose shape doesn't match the Lite structs — extract
+            # from an untyped parse below instead of dropping the document
             pass
+        except ValueError:
+            return None
+        else:
+            if lite.agent is not None:
+                summary["title"] = lite.agent.id
+                if lite.agent.llm is not None:
+                    summary["model"] = lite.agent.llm.model
+            agent_usage = None
+            if lite.stats is not None and lite.stats.usage_to_metrics:
+                agent_usage = lite.stats.usage_to_metrics.get("agent")
+            if (
+                agent_usage is not None
+                and agent_usage.accumulated_token_usage is not None
+            ):
+                token_usage = agent_usage.accumulated_token_usage
+                summary["prompt_tokens"] = token_usage.prompt_tokens
+                summary["completion_tokens"] = token_usage.completion_tokens
+                summary["reasoning_tokens"] = token_usage.reasoning_tokens
+                summary["cache_read_tokens"] = token_usage.cache_read_tokens
+            return summary
+
+    try:
+        base_state = loads_json(data)
+    except ValueError:
+        return None
+    if not isinstance(base_state, dict):
+        return None
+
+    # Get title from agent.id
+    agent = base_state.get("agent")
+    if isinstance(agent, dict):
+        summary["title"] = agent.get("id")
+        # Get model from agent.llm.model
+        llm = agent.get("llm", {})
+        if isinstance(llm, dict):
+            summary["model"] = llm.get("model")
+    # Get token usage from stats
+    stats = base_state.get("stats", {})
+    usage = stats.get("usage_to_metrics", {})
+    agent_usage = usage.get("agent", {})
+    token_usage = agent_usage.get("accumulated_token_usage", {})
+    summary["prompt_tokens"] = token_usage.get("prompt_tokens", 0)
+    summary["completion_tokens"] = token_usage.get("completion_tokens", 0)
+    summary["reasoning_tokens"] = token_usage.get("reasoning_tokens", 0)
+    summary["cache_read_tokens"] = token_usage.get("cache_read_tokens", 0)
+
+    return summary
+
+
+def _read_event_file(path: Path):
+    """Read one event file's bytes, returning the OSError instead of raising."""
+    try:
+        return path.read_bytes()
+    except OSError as e:
+        return e
+
+
+def load_events(event_files: list[Path]) -> tuple[list, list]:
+    """Load the given event files, sorted by timestamp.
+
+    Each event file is validated but kept as raw JSON bytes — events.json is
+    assembled by concatenation, never by re-serializing the parsed objects.
 
-    # Count events and calculate avg turn time and total conversation time
-    events = []
-    if events_dir.exists():
-        event_files = sorted(events_dir.glob("event-*.json"))
-        event_count = len(event_files)
-
-        # Load all events
-        for event_file in event_files:
-            try:
-                with open(event_file, "r") as f:
-                    event = json.load(f)
-                    events.append(event)
-            except (json.JSONDecodeError, IOError):
-                continue
+    Returns:
+        Tuple of (event_blobs, event_meta) where event_blobs holds each
+        event's raw JSON bytes and event_meta is a list of aligned
+        (source, timestamp) tuples
+    """
+    if not event_files:
+        return [], []
 
-        # Sort events by timestamp
-        events.sort(key=lambda e: e.get("timestamp", ""))
+    records = []
+
+    # Overlap the per-file open/read syscalls with a small thread pool;
+    # decoding stays serial on this thread
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        raw_blobs = list(executor.map(_read_event_file, event_files))
+
+    for event_file, data in zip(event_files, raw_blobs):
+        if isinstance(data, OSError):
+            print(f"Warning: Error reading {event_file}: {data}")
+            continue
+        try:
+            if msgspec is not None:
+                # Typed decode validates the document and skips allocating
+                # the (large) unused fields
+                try:
+                    meta = _event_meta_decoder.decode(data)
+                    source, timestamp = meta.source, meta.timestamp
+                except msgspec.ValidationError:
+                    # Valid JSON with unexpected field types — keep the event
+                    # and extract the fields from an untyped parse
+                    event = loads_json(data)
+                    source = event.get("source")
+                    timestamp = event.get("timestamp")
+            else:
+                event = loads_json(data)
+                source = event.get("source")
+                timestamp = event.get("timestamp")
+        except ValueError as e:
+            print(f"Warning: Error reading {event_file}: {e}")
+            continue
+        # Sort key stringified defensively: malformed events may carry a
+        # non-string timestamp
+        records.append(
+            (str(timestamp) if timestamp else "", data.strip(), source, timestamp)
+        )
+
+    # Sort events by timestamp
+    records.sort(key=lambda r: r[0])
+
+    event_blobs = [record[1] for record in records]
+    event_meta = [(record[2], record[3]) for record in records]
+    return event_blobs, event_meta
+
+
+def build_events_bytes(event_blobs: list) -> bytes:
+    """Compose events.json by concatenating raw event bytes into a JSON array."""
+    return b"[\n" + b",\n".join(event_blobs) + b"\n]"
+
+
+def compute_trajectory_metadata(
+    trajectory_path: Path, dir_mtime: float, base_summary: dict, event_meta: list
+) -> dict:
+    """Compute metadata for a single trajectory from its parsed source files.
+
+    Args:
+        trajectory_path: Source directory for the trajectory
+        dir_mtime: The trajectory directory's mtime (from scan time)
+        base_summary: Scalar fields from summarize_base_state
+        event_meta: List of (source, timestamp) tuples sorted by timestamp
+    """
+    trajectory_id = trajectory_path.name
+
+    title = base_summary["title"] or trajectory_id
+    model = base_summary["model"]
+    prompt_tokens = base_summary["prompt_tokens"]
+    completion_tokens = base_summary["completion_tokens"]
+    reasoning_tokens = base_summary["reasoning_tokens"]
+    cache_read_tokens = base_summary["cache_read_tokens"]
+    avg_agent_turn_time = 0
+    total_conversation_time = 0
+
+    if event_meta:
+        # Parse each timestamp to epoch seconds once; the interval math below
+        # then runs on plain floats
+        parsed_events = [
+            (parse_timestamp(timestamp), source) for source, timestamp in event_meta
+        ]
 
         # Calculate total conversation time (excluding user message intervals)
-        total_conversation_time = compute_total_conversation_time(events)
+        total_conversation_time = compute_total_conversation_time(parsed_events)
 
         # Calculate average agent turn time
         agent_turn_times = []
-        last_trigger_timestamp = None
+        last_trigger_epoch = None
 
-        for event in events:
-            event_source = event.get("source")
-            event_timestamp = event.get("timestamp")
-
-            if not event_timestamp:
+        for epoch, source in parsed_events:
+            if epoch is None:
                 continue
 
-            if event_source == "agent" and last_trigger_timestamp:
-                try:
-                    current_dt = datetime.fromisoformat(
-                        event_timestamp.replace("Z", "+00:00")
-                    )
-                    prev_dt = datetime.fromisoformat(
-                        last_trigger_timestamp.replace("Z", "+00:00")
-                    )
-                    duration = (current_dt - prev_dt).total_seconds()
-                    if duration > 0:
-                        agent_turn_times.append(duration)
-                except (ValueError, TypeError):
-                    pass
-            last_trigger_timestamp = event_timestamp
+            if source == "agent" and last_trigger_epoch is not None:
+                duration = epoch - last_trigger_epoch
+                if duration > 0:
+                    agent_turn_times.append(duration)
+            last_trigger_epoch = epoch
 
         if agent_turn_times:
             avg_agent_turn_time = round(
@@ -157,8 +401,8 @@ def compute_trajectory_metadata(trajectory_path: Path) -> dict:
         "id": trajectory_id,
         "title": title,
         "model": model,
-        "created": time.ctime(trajectory_path.stat().st_mtime),
-        "eventCount": event_count,
+        "created": time.ctime(dir_mtime),
+        "eventCount": len(event_meta),
         "promptTokens": prompt_tokens,
         "completionTokens": completion_tokens,
         "reasoningTokens": reasoning_tokens,
@@ -170,57 +414,60 @@ def compute_trajectory_metadata(trajectory_path: Path) -> dict:
     }
 
 
-def build_trajectory_detail(trajectory_path: Path) -> dict:
-    """Build detailed trajectory data."""
-    trajectory_id = trajectory_path.name
-    base_state_path = trajectory_path / "base_state.json"
-    events_dir = trajectory_path / "events"
+def build_trajectory_detail(
+    trajectory_path: Path,
+    dir_mtime: float,
+    base_state_bytes: bytes | None,
+    model: str | None,
+    event_count: int,
+    pretty: bool = False,
+) -> bytes:
+    """Compose trajectory.json bytes, splicing base_state.json in verbatim.
 
-    trajectory = {
-        "id": trajectory_id,
-        "created": time.ctime(trajectory_path.stat().st_mtime),
-        "eventCount": 0,
+    The base_state content is passed through unchanged, so its bytes are
+    embedded directly rather than parsed and re-serialized.
+    """
+    wrapper = {
+        "id": trajectory_path.name,
+        "created": time.ctime(dir_mtime),
+        "eventCount": event_count,
     }
 
-    if base_state_path.exists():
-        try:
-            with open(base_state_path, "r") as f:
-                base_state = json.load(f)
-                trajectory["baseState"] = base_state
-                agent = base_state.get("agent", {})
-                if isinstance(agent, dict):
-                    llm = agent.get("llm", {})
-                    if isinstance(llm, dict):
-                        trajectory["model"] = llm.get("model")
-        except (json.JSONDecodeError, IOError):
-            pass
-
-    if events_dir.exists():
-        trajectory["eventCount"] = len(list(events_dir.glob("event-*.json")))
-
-    return trajectory
-
-
-def build_events(trajectory_path: Path) -> list:
-    """Build events list for a trajectory."""
-    events_dir = trajectory_path / "events"
+    if base_state_bytes is None:
+        return dumps_json(wrapper, pretty)
 
-    if not events_dir.exists():
-        return []
+    wrapper["model"] = model
+    head = dumps_json(wrapper, pretty)
+    # head ends with the closing brace of the wrapper object
+    return head[: head.rfind(b"}")] + b',"baseState":' + base_state_bytes.strip() + b"}"
 
-    events = []
-    event_files = sorted(events_dir.glob("event-*.json"))
 
-    for event_file in event_files:
-        try:
-            with open(event_file, "r") as f:
-                event = json.load(f)
-                events.append(event)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Error reading {event_file}: {e}")
-            continue
+def load_trajectory(
+    trajectory_path: Path,
+    event_files: list[Path],
+    dir_mtime: float,
+    pretty: bool = False,
+) -> tuple[dict, bytes, list]:
+    """Load a trajectory, opening each source file exactly once.
 
-    return events
+    Returns:
+        Tuple of (metadata, detail_bytes, event_blobs)
+    """
+    base_state_bytes = load_base_state(trajectory_path)
+    base_summary = summarize_base_state(base_state_bytes)
+    if base_summary is None:
+        # Missing or unparseable — never splice bad bytes into trajectory.json
+        base_state_bytes = None
+        base_summary = dict(_BASE_SUMMARY_DEFAULTS)
+    event_blobs, event_meta = load_events(event_files)
+    metadata = compute_trajectory_metadata(
+        trajectory_path, dir_mtime, base_summary, event_meta
+    )
+    detail_bytes = build_trajectory_detail(
+        trajectory_path, dir_mtime, base_state_bytes, base_summary["model"],
+        len(event_blobs), pretty,
+    )
+    return metadata, detail_bytes, event_blobs
 
 
 def get_conversations_dir(input_path: Path = None) -> tuple[Path, bool]:
@@ -232,11 +479,9 @@ def get_conversations_dir(input_path: Path = None) -> tuple[Path, bool]:
     Returns:
         Tuple of (conversations_dir, is_custom)
     """
-    default_dir = Path.home() / ".openhands" / "conversations"
-
     if input_path is None:
         # Default to ~/.openhands/conversations
-        return default_dir, False
+        return _DEFAULT_CONV_DIR, False
 
     # User provided a path - resolve it
     resolved_path = input_path.expanduser().resolve()
@@ -246,26 +491,94 @@ def get_conversations_dir(input_path: Path = None) -> tuple[Path, bool]:
         resolved_path = resolved_path / "conversations"
 
     # Check if this is the default path
-    is_custom = resolved_path != default_dir
+    is_custom = resolved_path != _DEFAULT_CONV_DIR
 
     return resolved_path, is_custom
 
 
-def get_source_mtime(trajectory_path: Path) -> float:
-    """Get the latest modification time across all source files in a trajectory."""
-    mtime = trajectory_path.stat().st_mtime
-    base_state = trajectory_path / "base_state.json"
-    if base_state.exists():
-        mtime = max(mtime, base_state.stat().st_mtime)
-    events_dir = trajectory_path / "events"
-    if events_dir.exists():
-        for f in events_dir.glob("event-*.json"):
-            mtime = max(mtime, f.stat().st_mtime)
-    return mtime
+def scan_trajectory(
+    trajectory_path: Path, dir_mtime: float | None = None
+) -> tuple[list[Path], float]:
+    """Scan a trajectory's source files with the minimum number of syscalls.
+
+    One os.scandir over the trajectory directory covers base_state.json and
+    locates the events subdir; a second over the events subdir yields the
+    event file list and their mtimes. Staleness checks and loading both feed
+    off this result, so nothing is stat'ed twice.
+
+    Args:
+        trajectory_path: Source directory for the trajectory
+        dir_mtime: The directory's own mtime, if the caller already has it
+                   from a scandir of the parent
+
+    Returns:
+        Tuple of (event files sorted by name, latest source mtime)
+    """
+    mtime = dir_mtime if dir_mtime is not None else trajectory_path.stat().st_mtime
+    events_dir = None
+    with os.scandir(trajectory_path) as it:
+        for dir_entry in it:
+            if dir_entry.name == "base_state.json":
+                mtime = max(mtime, dir_entry.stat().st_mtime)
+            elif dir_entry.name == "events" and dir_entry.is_dir():
+                events_dir = dir_entry.path
+    event_files = []
+    if events_dir is not None:
+        # scandir reuses stat information from the directory read instead of
+        # issuing one stat syscall per Path
+        with os.scandir(events_dir) as it:
+            for dir_entry in it:
+                if dir_entry.name.startswith("event-") and dir_entry.name.endswith(
+                    ".json"
+                ):
+                    mtime = max(mtime, dir_entry.stat().st_mtime)
+                    event_files.append(Path(dir_entry.path))
+    event_files.sort()
+    return event_files, mtime
+
+
+def process_trajectory(
+    trajectory_path: Path,
+    event_files: list[Path],
+    dir_mtime: float,
+    data_dir: Path,
+    pretty: bool = False,
+) -> dict:
+    """Rebuild one trajectory's outputs and return its metadata.
+
+    Runs in a worker process so trajectories can be processed in parallel.
+    Callers are expected to have already determined that a rebuild is due.
+
+    Args:
+        trajectory_path: Source directory for the trajectory
+        event_files: Event files discovered by scan_trajectory
+        dir_mtime: The trajectory directory's mtime (from scan time)
+        data_dir: Output data directory
+
+    Returns:
+        Metadata dict for trajectories.json
+    """
+    print(f"   Processing: {trajectory_path.name}")
+
+    # Single pass over source files
+    metadata, detail_bytes, event_blobs = load_trajectory(
+        trajectory_path, event_files, dir_mtime, pretty
+    )
+
+    traj_output_dir = data_dir / trajectory_path.name
+    traj_output_dir.mkdir(exist_ok=True)
+
+    write_if_changed(traj_output_dir / "trajectory.json", detail_bytes)
+    write_if_changed(traj_output_dir / "events.json", build_events_bytes(event_blobs))
+
+    return metadata
 
 
 def build_static_site(
-    conversations_dir: Path, output_dir: Path, is_custom_dir: bool = False
+    conversations_dir: Path,
+    output_dir: Path,
+    is_custom_dir: bool = False,
+    pretty: bool = False,
 ):
     """Build the static site (incremental — only processes changed trajectories)."""
     print("🔨 Building static site...")
@@ -278,6 +591,16 @@ def build_static_site(
     data_dir = output_dir / "data"
     data_dir.mkdir(exist_ok=True)
 
+    # Load the metadata cache (id -> {"mtime": float, "metadata": {...}}) so
+    # unchanged trajectories don't have to be re-parsed just for trajectories.json
+    cache_path = data_dir / "_meta_cache.json"
+    meta_cache = {}
+    if cache_path.exists():
+        try:
+            meta_cache = load_json(cache_path)
+        except (ValueError, IOError):
+            meta_cache = {}
+
     # Collect all trajectories
     trajectories = []
     source_ids = set()
@@ -287,46 +610,67 @@ def build_static_site(
     if not conversations_dir.exists():
         print(f"⚠️  Warning: Conversations directory not found: {conversations_dir}")
     else:
-        for entry in sorted(
-            conversations_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True
-        ):
-            # Only process directories that look like trajectory IDs (32 hex chars)
+        # Only process directories that look like trajectory IDs (32 hex chars),
+        # newest first. Collected as parallel mtime/path arrays so huge archives
+        # can be ordered with a vectorized argsort instead of a Python-level sort
+        mtimes = []
+        paths = []
+        with os.scandir(conversations_dir) as it:
+            for dir_entry in it:
+                if dir_entry.is_dir() and _HEX32.match(dir_entry.name):
+                    mtimes.append(dir_entry.stat().st_mtime)
+                    paths.append(dir_entry.path)
+        # Both branches sort stably on negated mtime, so entries with equal
+        # mtimes keep scandir order regardless of whether numpy is installed
+        if np is not None:
+            order = np.argsort(-np.fromiter(mtimes, dtype=np.float64), kind="stable")
+        else:
+            order = sorted(range(len(mtimes)), key=lambda i: -mtimes[i])
+        entries = [(Path(paths[i]), mtimes[i]) for i in order]
+        source_ids = {entry.name for entry, _ in entries}
+
+        # Decide which trajectories actually need a rebuild: cached metadata is
+        # reused when neither the sources nor the outputs have changed
+        metadata_by_id = {}
+        source_mtimes = {}
+        to_rebuild = []
+        for entry, dir_mtime in entries:
+            event_files, source_mtime = scan_trajectory(entry, dir_mtime)
+            source_mtimes[entry.name] = source_mtime
+            cached = meta_cache.get(entry.name)
+            events_output = data_dir / entry.name / "events.json"
+            # The cache mtime is authoritative for freshness; the output file's
+            # own mtime is deliberately not consulted, since unchanged content
+            # is left untouched on rebuild
             if (
-                entry.is_dir()
-                and len(entry.name) == 32
-                and all(c in "0123456789abcdef" for c in entry.name.lower())
+                cached
+                and cached.get("mtime", 0) >= source_mtime
+                and events_output.exists()
             ):
-                source_ids.add(entry.name)
-
-                # Compute metadata (always needed for trajectories.json)
-                metadata = compute_trajectory_metadata(entry)
-                trajectories.append(metadata)
-
-                # Check if output is already up to date
-                traj_output_dir = data_dir / entry.name
-                events_output = traj_output_dir / "events.json"
-
-                if events_output.exists():
-                    source_mtime = get_source_mtime(entry)
-                    output_mtime = events_output.stat().st_mtime
-                    if source_mtime <= output_mtime:
-                        skipped_count += 1
-                        continue
-
-                # Source is newer or output doesn't exist — rebuild this trajectory
-                print(f"   Processing: {entry.name}")
-                rebuilt_count += 1
-                traj_output_dir.mkdir(exist_ok=True)
-
-                # Build and save trajectory detail
-                trajectory_detail = build_trajectory_detail(entry)
-                with open(traj_output_dir / "trajectory.json", "w") as f:
-                    json.dump(trajectory_detail, f, indent=2, default=str)
-
-                # Build and save events
-                events = build_events(entry)
-                with open(traj_output_dir / "events.json", "w") as f:
-                    json.dump(events, f, indent=2, default=str)
+                metadata_by_id[entry.name] = cached["metadata"]
+                skipped_count += 1
+            else:
+                to_rebuild.append((entry, event_files, dir_mtime))
+
+        # Process stale trajectories in parallel — each one is independent
+        if to_rebuild:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(
+                    partial(process_trajectory, data_dir=data_dir, pretty=pretty),
+                    [entry for entry, _, _ in to_rebuild],
+                    [event_files for _, event_files, _ in to_rebuild],
+                    [dir_mtime for _, _, dir_mtime in to_rebuild],
+                    chunksize=4,
+                )
+                for (entry, _, _), metadata in zip(to_rebuild, results):
+                    metadata_by_id[entry.name] = metadata
+                    meta_cache[entry.name] = {
+                        "mtime": source_mtimes[entry.name],
+                        "metadata": metadata,
+                    }
+                    rebuilt_count += 1
+
+        trajectories = [metadata_by_id[entry.name] for entry, _ in entries]
 
     # Remove output directories for trajectories that no longer exist in source
     removed_count = 0
@@ -338,15 +682,24 @@ def build_static_site(
 
     print(f"\n   Rebuilt: {rebuilt_count}, Skipped (unchanged): {skipped_count}, Removed: {removed_count}")
 
-    # Save trajectories list
-    with open(data_dir / "trajectories.json", "w") as f:
-        json.dump(trajectories, f, indent=2, default=str)
+    # Nothing changed — existing outputs are already correct, so skip the
+    # trajectories.json rewrite and the (expensive) Vite build entirely
+    trajectories_path = data_dir / "trajectories.json"
+    if rebuilt_count == 0 and removed_count == 0 and trajectories_path.exists():
+        print("\n✅ No changes; skipping Vite rebuild")
+        return
+
+    # Save trajectories list and the metadata cache (dropping removed ids),
+    # leaving the files untouched when their content is unchanged
+    write_if_changed(trajectories_path, dumps_json(trajectories, pretty))
+    meta_cache = {k: v for k, v in meta_cache.items() if k in source_ids}
+    write_if_changed(cache_path, dumps_json(meta_cache))
 
     # Build React app with Vite
     print("\n📦 Building React app with Vite...")
     result = subprocess.run(
         ["npm", "run", "build"],
-        cwd=Path(__file__).parent,
+        cwd=_MODULE_DIR,
         capture_output=True,
         text=True
     )
@@ -374,16 +727,10 @@ def build_static_site(
         }};
         </script>
 '''
-        # Insert before the main script tag
-        html_content = html_content.replace(
-            '<script type="module" crossorigin',
-            static_config + '<script type="module" crossorigin'
-        )
-
         # Add file:// protocol detection
         file_protocol_check = '''<script>
-        (function() {{
-            if (window.location.protocol === 'file:') {{
+        (function() {
+            if (window.location.protocol === 'file:') {
                 document.body.innerHTML = `
                     <div style="padding: 40px; font-family: sans-serif; max-width: 600px; margin: 0 auto;">
                         <h1 style="color: #e76f51;">⚠️ Cannot Load Trajectories</h1>
@@ -402,11 +749,31 @@ def build_static_site(
                         <p>Then open <code>http://localhost:8050</code> in your browser.</p>
                     </div>
                 `;
-            }}
-        }})();
+            }
+        })();
         </script>
 '''
-        html_content = html_content.replace('</head>', file_protocol_check + '</head>')
+        # Locate both insertion points up front and splice in a single pass
+        # instead of scanning (and reallocating) the document per replace:
+        # static_config goes before the main module script, the file://
+        # check before </head>
+        insertions = []
+        idx_script = html_content.find('<script type="module" crossorigin')
+        if idx_script != -1:
+            insertions.append((idx_script, static_config))
+        idx_head = html_content.find('</head>')
+        if idx_head != -1:
+            insertions.append((idx_head, file_protocol_check))
+        insertions.sort()
+
+        parts = []
+        prev = 0
+        for idx, snippet in insertions:
+            parts.append(html_content[prev:idx])
+            parts.append(snippet)
+            prev = idx
+        parts.append(html_content[prev:])
+        html_content = "".join(parts)
 
         with open(html_output, "w") as f:
             f.write(html_content)
@@ -436,15 +803,20 @@ def main():
     parser.add_argument(
         "--output-dir",
         type=Path,
-        default=Path(__file__).parent / "dist",
+        default=_MODULE_DIR / "dist",
         help="Output directory for static site (default: ./dist)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print output JSON (larger and slower; the viewer doesn't need it)",
+    )
     args = parser.parse_args()
 
     # Get conversations directory and custom flag
     conversations_dir, is_custom = get_conversations_dir(args.conversations_dir)
 
-    build_static_site(conversations_dir, args.output_dir, is_custom)
+    build_static_site(conversations_dir, args.output_dir, is_custom, args.pretty)
 
 
 if __name__ == "__main__":